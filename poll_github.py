@@ -5,7 +5,6 @@ from datetime import datetime, timezone, timedelta
 
 TRACKED_FILE = 'data/tracked.json'
 NOTIFIED_FILE = 'data/notified.json'
-BADGE_FILE = 'badge/tracked-count.json'
 RELEASES_FILE = 'data/releases.json'
 BOT_TOKEN = os.environ['TELEGRAM_BOT_TOKEN']
 CHANNEL = os.environ['TELEGRAM_CHANNEL']
@@ -174,15 +173,5 @@ def main():
 
     save_json(NOTIFIED_FILE, notified)
 
-    # Badge update
-    os.makedirs('badge', exist_ok=True)
-    with open(BADGE_FILE, 'w') as f:
-        json.dump({
-            'schemaVersion': 1,
-            'label': 'tracked repos',
-            'message': str(len(tracked)),
-            'color': 'brightgreen'
-        }, f)
-
 if __name__ == '__main__':
     main()
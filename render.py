@@ -0,0 +1,181 @@
+import os
+import sys
+import json
+import hashlib
+from collections import Counter
+
+RELEASES_FILE = 'data/releases.json'
+RENDER_CACHE_FILE = 'data/render_cache.json'
+BADGE_FILE = 'badge/tracked-count.json'
+LATEST_BADGE_FILE = 'badge/latest-release.json'
+CHART_FILE = 'badge/releases-chart.png'
+CACHE_VERSION = 1
+
+def load_json_or_default(file_path, default):
+    if os.path.exists(file_path):
+        try:
+            with open(file_path) as f:
+                return json.load(f)
+        except Exception:
+            return default
+    else:
+        return default
+
+def write_if_changed(file_path, text):
+    # Skip the write (and the resulting git diff) when content is identical
+    if os.path.exists(file_path):
+        with open(file_path) as f:
+            if f.read() == text:
+                return False
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w') as f:
+        f.write(text)
+    return True
+
+def releases_hash(releases_data):
+    canonical = json.dumps(
+        sorted(releases_data, key=lambda r: r.get('repo', '')),
+        sort_keys=True, separators=(',', ':')
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+def release_month(entry):
+    # "YYYY-MM-DD" -> "YYYY-MM"; repos without a valid release have no month
+    date = entry.get('date') or ''
+    return date[:7] if len(date) >= 7 else None
+
+def full_monthly_counts(new_dates):
+    return dict(Counter(m for m in new_dates.values() if m))
+
+def update_monthly_counts(monthly, old_dates, new_dates):
+    """Apply only the per-repo differences to the cached monthly counts.
+
+    The cached counts are first checked month by month against the cached
+    per-repo months; on any mismatch they are rebuilt from a full recount,
+    so a bad cache is corrected on the next render instead of persisting.
+
+    >>> old = {'a/x': '2025-01', 'b/y': '2025-01', 'c/z': None}
+    >>> new = {'a/x': '2025-03', 'c/z': '2025-02', 'd/w': '2025-03'}
+    >>> cached = full_monthly_counts(old)
+    >>> update_monthly_counts(dict(cached), old, new) == full_monthly_counts(new)
+    True
+    >>> update_monthly_counts({'2025-01': 5}, old, new) == full_monthly_counts(new)
+    True
+    >>> update_monthly_counts({'2025-01': 'x'}, old, new) == full_monthly_counts(new)
+    True
+    >>> update_monthly_counts({'2025-01': 2}, {'a': '2025-01', 'b': '2025-02'},
+    ...                       {'a': '2025-03', 'b': '2025-02'}) == {'2025-02': 1, '2025-03': 1}
+    True
+    """
+    if monthly != full_monthly_counts(old_dates):
+        return full_monthly_counts(new_dates)
+    for repo in old_dates.keys() | new_dates.keys():
+        old, new = old_dates.get(repo), new_dates.get(repo)
+        if old == new:
+            continue
+        if old:
+            monthly[old] -= 1
+            if monthly[old] == 0:
+                del monthly[old]
+        if new:
+            monthly[new] = monthly.get(new, 0) + 1
+    return monthly
+
+def render_badges(releases_data):
+    write_if_changed(BADGE_FILE, json.dumps({
+        'schemaVersion': 1,
+        'label': 'tracked repos',
+        'message': str(len({r['repo'] for r in releases_data})),
+        'color': 'brightgreen'
+    }))
+    dates = [r['date'] for r in releases_data if r.get('date')]
+    write_if_changed(LATEST_BADGE_FILE, json.dumps({
+        'schemaVersion': 1,
+        'label': 'latest release',
+        'message': max(dates) if dates else 'none',
+        'color': 'blue'
+    }))
+
+def month_range(first, last):
+    """Every "YYYY-MM" from first to last, so empty months still get a bar.
+
+    >>> month_range('2024-11', '2025-02')
+    ['2024-11', '2024-12', '2025-01', '2025-02']
+    """
+    year, month = map(int, first.split('-'))
+    months = []
+    while f'{year:04d}-{month:02d}' <= last:
+        months.append(f'{year:04d}-{month:02d}')
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+def render_chart(monthly):
+    # matplotlib is slow to import, so only pay for it when the chart is redrawn
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    months = month_range(min(monthly), max(monthly)) if monthly else []
+    counts = [monthly.get(m, 0) for m in months]
+    fig, ax = plt.subplots(figsize=(10, 4))
+    ax.bar(months, counts, color='#2ea44f')
+    ax.set_title('Latest releases of tracked repos, by month')
+    ax.set_ylabel('Repos')
+    step = max(1, len(months) // 12)
+    ax.set_xticks(range(0, len(months), step))
+    ax.set_xticklabels(months[::step], rotation=45, ha='right')
+    fig.tight_layout()
+    os.makedirs(os.path.dirname(CHART_FILE), exist_ok=True)
+    fig.savefig(CHART_FILE)
+    plt.close(fig)
+
+def load_cache():
+    # Anything that isn't a well-formed cache is treated as empty
+    cache = load_json_or_default(RENDER_CACHE_FILE, {})
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        return {}
+    if not isinstance(cache.get('repo_months'), dict) or not isinstance(cache.get('monthly'), dict):
+        return {}
+    return cache
+
+def needs_render(releases_data, cache):
+    outputs = (BADGE_FILE, LATEST_BADGE_FILE, CHART_FILE)
+    return (cache.get('hash') != releases_hash(releases_data)
+            or not all(os.path.exists(p) for p in outputs))
+
+def render_all(releases_data=None):
+    # Returns True if anything was re-rendered, False if the cache was fresh
+    if releases_data is None:
+        releases_data = load_json_or_default(RELEASES_FILE, None)
+    if not isinstance(releases_data, list):
+        # Missing or unreadable releases.json: keep the last good outputs
+        return False
+    cache = load_cache()
+    if not needs_render(releases_data, cache):
+        return False
+
+    new_dates = {r['repo']: release_month(r) for r in releases_data}
+    old_dates = cache.get('repo_months', {})
+    cached_monthly = cache.get('monthly', {})
+    monthly = update_monthly_counts(dict(cached_monthly), old_dates, new_dates)
+
+    render_badges(releases_data)
+    # Tag-only edits or a new release in the same month leave the chart as is
+    if monthly != cached_monthly or not os.path.exists(CHART_FILE):
+        render_chart(monthly)
+
+    write_if_changed(RENDER_CACHE_FILE, json.dumps({
+        'version': CACHE_VERSION,
+        'hash': releases_hash(releases_data),
+        'repo_months': new_dates,
+        'monthly': monthly
+    }, indent=2, sort_keys=True))
+    return True
+
+if __name__ == '__main__':
+    if '--check' in sys.argv[1:]:
+        # Exit 1 when a render is due, without importing matplotlib
+        releases_data = load_json_or_default(RELEASES_FILE, None)
+        stale = isinstance(releases_data, list) and needs_render(releases_data, load_cache())
+        sys.exit(1 if stale else 0)
+    render_all()